@@ -0,0 +1,49 @@
+import os
+
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+
+
+REDIS_URL = os.environ.get('REDIS_URL', 'redis://localhost:6379/0')
+BLOG_TTL = 60
+# how long an invalidated key refuses refills (see invalidate)
+TOMBSTONE_TTL = 5
+TOMBSTONE = b''
+
+# both timeouts matter: without socket_timeout a Redis that accepts but never
+# replies would hang the request instead of falling back to the db
+redis = aioredis.from_url(REDIS_URL, decode_responses = False, socket_connect_timeout = 0.5, socket_timeout = 0.5)
+
+
+def blog_key(id: int) -> str:
+    return f"blog:{id}"
+
+# cache failures are treated as misses so the endpoints keep working off the db
+
+async def get(key: str):
+    try:
+        value = await redis.get(key)
+    except RedisError:
+        return None
+    return None if value == TOMBSTONE else value
+
+async def put(key: str, value: bytes, expire: int = BLOG_TTL):
+    # NX: never overwrite a live entry or a tombstone, see invalidate
+    try:
+        await redis.set(key, value, ex = expire, nx = True)
+    except RedisError:
+        pass
+
+async def invalidate(key: str):
+    # Write a short-lived tombstone rather than deleting the key: a reader
+    # that loaded the old row before our commit would otherwise SET it back
+    # and serve it for the full BLOG_TTL. With the tombstone in place its NX
+    # put fails. Only a reader stalled longer than TOMBSTONE_TTL between its
+    # SELECT and its put can still cache a stale body.
+    try:
+        await redis.set(key, TOMBSTONE, ex = TOMBSTONE_TTL)
+    except RedisError:
+        pass
+
+async def close():
+    await redis.aclose()
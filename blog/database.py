@@ -1,12 +1,51 @@
-from sqlalchemy import create_engine, false
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from contextvars import ContextVar
 
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base
 
-SQLALCHEMY_DATABASE_URL = 'sqlite:///./blog.db' 
-engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args = {"check_same_thread": False})
+
+# the tree runs on a local SQLite file, so the async driver is aiosqlite;
+# point this at "postgresql+asyncpg://..." to run against Postgres
+SQLALCHEMY_DATABASE_URL = 'sqlite+aiosqlite:///./blog.db'
+# create_async_engine picks AsyncAdaptedQueuePool on its own, so only the
+# sizing is set here; passing QueuePool explicitly breaks the async engine
+engine = create_async_engine(
+    SQLALCHEMY_DATABASE_URL,
+    connect_args = {"check_same_thread": False},
+    pool_size = 10,
+    max_overflow = 20,
+    pool_timeout = 30,
+    pool_pre_ping = True,
+    pool_recycle = 1800,
+)
 
 Base = declarative_base()
 
-SessionLocal = sessionmaker(bind = engine, autocommit = False, autoflush= false,)
+SessionLocal = async_sessionmaker(bind = engine, class_ = AsyncSession, autoflush = False, expire_on_commit = False)
+
+
+def pool_status() -> str:
+    # checked-in / checked-out / overflow counts, served at GET /debug/pool
+    return engine.pool.status()
+
+# one session per request, opened by DBSessionMiddleware and read back by get_db;
+# a plain async dependency avoids the generator/exit-stack setup of a yield dependency
+_db_session: ContextVar[AsyncSession] = ContextVar('db_session')
+
+class DBSessionMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+        async with SessionLocal() as db:
+            token = _db_session.set(db)
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                _db_session.reset(token)
 
+async def get_db() -> AsyncSession:
+    return _db_session.get()
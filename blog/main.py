@@ -1,56 +1,30 @@
-from fastapi import Depends, FastAPI, HTTPException, Response, status
-from sqlalchemy import delete
-from . import schemas, models
-from .database import SessionLocal, engine
-from sqlalchemy.orm import Session 
-app = FastAPI()
+from contextlib import asynccontextmanager
 
-models.Base.metadata.create_all(engine)
+from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from . import cache, models
+from .database import DBSessionMiddleware, engine, pool_status
+from .routers import blogs
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    async with engine.begin() as conn:
+        await conn.run_sync(models.Base.metadata.create_all)
+    yield
+    await cache.close()
+    await engine.dispose()
 
-@app.post('/blog', status_code= status.HTTP_201_CREATED)
-def create(request: schemas.Blog, db: Session = Depends(get_db)):
-    new_blog = models.Blog(title = request.title, body = request.body)
-    db.add(new_blog)
-    db.commit()
-    db.refresh(new_blog)
-    return new_blog
+app = FastAPI(lifespan = lifespan, default_response_class = ORJSONResponse)
 
-@app.get('/blog')
-# we will get list of blogs from here
-def all(db: Session = Depends(get_db)):
-    blogs = db.query(models.Blog).all()
-    return blogs
+app.add_middleware(DBSessionMiddleware)
+# list pages are repetitive JSON; small single-blog bodies stay uncompressed
+app.add_middleware(GZipMiddleware, minimum_size = 1024, compresslevel = 5)
 
-@app.get('/blog/{id}', status_code = 200)
+app.include_router(blogs.router)
 
-def show(id: int, response: Response, db: Session = Depends(get_db)):
-    blog = db.query(models.Blog).filter(models.Blog.id == id).first()
-    if not blog:
-        raise HTTPException(status_code= status.HTTP_404_NOT_FOUND, detail= f"Blog with the id {id} is not avaliable")
-    return blog
-
-@app.delete('/blog/{id}', status_code=status.HTTP_204_NO_CONTENT)
-def destory(id, db: Session = Depends(get_db)):
-    blog = db.query(models.Blog).filter(models.Blog.id == id)
-    if not blog.first():
-        raise HTTPException(status_code= status.HTTP_404_NOT_FOUND, detail = f"Blog with id {id} not found")
-    blog.delete(synchronize_session= False)
-    db.commit()
-    return "Done"
-
-@app.put('blog/{id}', status_code= status.HTTP_202_ACCEPTED)
-def update(id, request: schemas.Blog, db: Session = Depends(get_db)):
-    blog = db.query(models.Blog).filter(models.Blog.id == id).update(request.body)
-    if not blog.first():
-        raise HTTPException(status_code= status.HTTP_404_NOT_FOUND, detail = f"Blog with id {id} not found")
-    blog.update(request.body)
-    db.commit()
-    return "Updated successfully"
\ No newline at end of file
+@app.get('/debug/pool', include_in_schema = False)
+async def pool():
+    # live connection pool counters for ops when tuning pool_size / max_overflow
+    return {"pool": pool_status()}
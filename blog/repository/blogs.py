@@ -0,0 +1,62 @@
+from typing import Optional
+
+import msgspec
+from fastapi import HTTPException, Response, status
+from sqlalchemy import bindparam, delete, lambda_stmt, select, update as sql_update
+from sqlalchemy.ext.asyncio import AsyncSession
+from .. import cache, schemas, models
+
+
+# built once so every lookup by id reuses the same cached, compiled statement
+blog_by_id = lambda_stmt(lambda: select(models.Blog).where(models.Blog.id == bindparam("id")))
+
+
+async def get_all(db: AsyncSession, limit: int, after_id: Optional[int]):
+    # plain columns, no ORM objects or identity map for a read-only list;
+    # keyset on the PK instead of OFFSET so every page costs the same
+    stmt = select(models.Blog.id, models.Blog.title, models.Blog.body).order_by(models.Blog.id).limit(limit)
+    if after_id is not None:
+        stmt = stmt.where(models.Blog.id > after_id)
+    result = await db.execute(stmt)
+    items = [schemas.ShowBlogMsg(**row._mapping) for row in result]
+    page = schemas.BlogPageMsg(items = items, next = items[-1].id if len(items) == limit else None)
+    return Response(content = msgspec.json.encode(page), media_type = "application/json")
+
+async def create(request: schemas.Blog, db: AsyncSession):
+    # flush inside the transaction block assigns the PK, so no refresh SELECT
+    async with db.begin():
+        new_blog = models.Blog(title = request.title, body = request.body)
+        db.add(new_blog)
+        await db.flush()
+    return new_blog
+
+async def show(id: int, db: AsyncSession):
+    # the cached value is the encoded response body, so a hit skips both the db and serialization
+    cached = await cache.get(cache.blog_key(id))
+    if cached is not None:
+        return Response(content = cached, media_type = "application/json")
+    blog = (await db.execute(blog_by_id, {"id": id})).scalars().first()
+    if not blog:
+        raise HTTPException(status_code= status.HTTP_404_NOT_FOUND, detail= f"Blog with the id {id} is not avaliable")
+    # built from the declared response model so the cached body always matches ShowBlog
+    payload = schemas.ShowBlog.model_validate(blog).model_dump_json().encode()
+    await cache.put(cache.blog_key(id), payload)
+    return Response(content = payload, media_type = "application/json")
+
+async def destroy(id: int, db: AsyncSession):
+    # single DELETE; rowcount tells us whether the blog existed
+    result = await db.execute(delete(models.Blog).where(models.Blog.id == id).execution_options(synchronize_session = False))
+    if result.rowcount == 0:
+        raise HTTPException(status_code= status.HTTP_404_NOT_FOUND, detail = f"Blog with id {id} not found")
+    await db.commit()
+    await cache.invalidate(cache.blog_key(id))
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+async def update(id: int, request: schemas.Blog, db: AsyncSession):
+    stmt = sql_update(models.Blog).where(models.Blog.id == id).values(**request.model_dump(exclude_unset = True))
+    result = await db.execute(stmt.execution_options(synchronize_session = False))
+    if result.rowcount == 0:
+        raise HTTPException(status_code= status.HTTP_404_NOT_FOUND, detail = f"Blog with id {id} not found")
+    await db.commit()
+    await cache.invalidate(cache.blog_key(id))
+    return "Updated successfully"
@@ -0,0 +1,35 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from .. import schemas
+from ..database import get_db
+from ..repository import blogs
+
+
+router = APIRouter(
+    prefix = '/blog',
+    tags = ['Blogs'],
+)
+
+
+@router.post('', status_code= status.HTTP_201_CREATED, response_model = schemas.ShowBlog)
+async def create(request: schemas.Blog, db: AsyncSession = Depends(get_db)):
+    return await blogs.create(request, db)
+
+@router.get('', response_model = None)
+# we will get list of blogs from here
+async def all(db: AsyncSession = Depends(get_db), limit: int = Query(50, ge = 1, le = 200), after_id: Optional[int] = Query(None, ge = 0, le = 2**31 - 1)):
+    return await blogs.get_all(db, limit, after_id)
+
+@router.get('/{id}', status_code = 200, response_model = schemas.ShowBlog)
+async def show(id: int, db: AsyncSession = Depends(get_db)):
+    return await blogs.show(id, db)
+
+@router.delete('/{id}', status_code=status.HTTP_204_NO_CONTENT)
+async def destory(id: int, db: AsyncSession = Depends(get_db)):
+    return await blogs.destroy(id, db)
+
+@router.put('/{id}', status_code= status.HTTP_202_ACCEPTED)
+async def update(id: int, request: schemas.Blog, db: AsyncSession = Depends(get_db)):
+    return await blogs.update(id, request, db)
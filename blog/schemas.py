@@ -1,5 +1,26 @@
-from pydantic import BaseModel
+from typing import Optional
+
+import msgspec
+from pydantic import BaseModel, ConfigDict
 
 class Blog(BaseModel):
     title: str
     body: str
+
+class ShowBlog(Blog):
+    model_config = ConfigDict(from_attributes = True)
+
+    id: int
+
+# outbound-only structs for the list endpoint: rows come straight from SQL,
+# so there is nothing to validate and msgspec encodes them directly
+
+class ShowBlogMsg(msgspec.Struct, kw_only = True):
+    # same field order as ShowBlog so list and detail responses agree
+    title: str
+    body: str
+    id: int
+
+class BlogPageMsg(msgspec.Struct):
+    items: list[ShowBlogMsg]
+    next: Optional[int]